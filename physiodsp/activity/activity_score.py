@@ -1,12 +1,141 @@
+import math
 from typing import Literal
 
 import numpy as np
-from pandas import DataFrame
+from pandas import DataFrame, concat
 from pydantic import BaseModel, Field, PositiveInt, PositiveFloat
 
 from physiodsp.base import BaseAlgorithm
 
 
+def _score_steps(daily_steps: float, baseline: float, ceiling: float, gaussian: bool) -> float:
+    """Score daily step count (0-100) against resolved baseline/ceiling."""
+    if gaussian:
+        if baseline == 0:
+            return 0.0
+        normalized = daily_steps / baseline
+        peak_normalized = ceiling / baseline
+        std_dev = (peak_normalized - 1.0) / 2.0
+        score = 100.0 * math.exp(-((normalized - 1.0) ** 2) / (2.0 * std_dev ** 2))
+    else:
+        if ceiling == 0:
+            return 0.0
+        score = min(100.0, (daily_steps / ceiling) * 100.0)
+
+    return min(max(score, 0.0), 100.0)
+
+
+def _score_sleep(sleep_hours: float, min_sleep: float, optimal: float, max_sleep: float) -> float:
+    """Score sleep duration (0-100) against resolved thresholds."""
+    if sleep_hours < min_sleep:
+        deficit = (min_sleep - sleep_hours) / min_sleep
+        score = max(0.0, 50.0 - deficit * 50.0)
+    elif sleep_hours <= optimal:
+        score = ((sleep_hours - min_sleep) / (optimal - min_sleep)) * 100.0
+    elif sleep_hours <= max_sleep:
+        score = 100.0 - ((sleep_hours - optimal) / (max_sleep - optimal)) * 30.0
+    else:
+        excess = sleep_hours - max_sleep
+        score = max(0.0, 70.0 - excess * 10.0)
+
+    return min(max(score, 0.0), 100.0)
+
+
+def _score_training(training_minutes: float, optimal: float, max_train: float) -> float:
+    """Score training time (0-100) against resolved thresholds."""
+    if training_minutes < 5:
+        score = 50.0
+    elif training_minutes <= optimal:
+        score = 50.0 + (training_minutes / optimal) * 50.0
+    elif training_minutes <= max_train:
+        excess_ratio = (training_minutes - optimal) / (max_train - optimal)
+        score = 100.0 + (excess_ratio * 10.0) - 10.0
+    else:
+        excess = training_minutes - max_train
+        score = max(0.0, 100.0 - excess * 0.5)
+
+    return min(max(score, 0.0), 100.0)
+
+
+def _score_resting(resting_minutes: float, min_hours: float, optimal_hours: float, max_hours: float) -> float:
+    """Score resting/recovery time (0-100) against resolved thresholds."""
+    resting_hours = resting_minutes / 60
+
+    if resting_hours < min_hours:
+        deficit = (min_hours - resting_hours)
+        score = max(0.0, 50.0 - deficit * 15.0)
+    elif resting_hours <= optimal_hours:
+        score = ((resting_hours - min_hours) / (optimal_hours - min_hours)) * 100.0
+    elif resting_hours <= max_hours:
+        excess_hours = resting_hours - optimal_hours
+        max_excess = max_hours - optimal_hours
+        score = 100.0 - (excess_hours / max_excess) * 25.0
+    else:
+        excess_hours = resting_hours - max_hours
+        score = max(0.0, 75.0 - excess_hours * 10.0)
+
+    return min(max(score, 0.0), 100.0)
+
+
+def _score_day(steps: float,
+               sleep_hours: float,
+               training_minutes: float,
+               resting_minutes: float,
+               params: tuple,
+               weights: tuple) -> tuple:
+    """
+    Compute all factor scores and the weighted activity score for one day.
+
+    Args:
+        steps, sleep_hours, training_minutes, resting_minutes: daily metrics
+        params: resolved scoring thresholds as produced by
+            `ActivityScore._resolve_scoring_params`
+        weights: (step_weight, sleep_weight, training_weight, resting_weight)
+
+    Returns:
+        Tuple (activity_score, step_score, sleep_score, training_score, resting_score)
+    """
+    (step_baseline, step_ceiling, gaussian,
+     sleep_min, sleep_opt, sleep_max,
+     train_opt, train_max,
+     rest_min_h, rest_opt_h, rest_max_h) = params
+
+    step_score = _score_steps(steps, step_baseline, step_ceiling, gaussian)
+    sleep_score = _score_sleep(sleep_hours, sleep_min, sleep_opt, sleep_max)
+    training_score = _score_training(training_minutes, train_opt, train_max)
+    resting_score = _score_resting(resting_minutes, rest_min_h, rest_opt_h, rest_max_h)
+
+    activity_score = (
+        (step_score * weights[0]) +
+        (sleep_score * weights[1]) +
+        (training_score * weights[2]) +
+        (resting_score * weights[3])
+    )
+
+    return activity_score, step_score, sleep_score, training_score, resting_score
+
+
+def _score_batch(metrics: np.ndarray, params: list, weights: tuple) -> np.ndarray:
+    """
+    Score a batch of days through the _score_day kernel.
+
+    Args:
+        metrics: (N, 4) array with columns
+            [steps, sleep_hours, training_minutes, resting_minutes]
+        params: One resolved threshold tuple per row
+        weights: (step_weight, sleep_weight, training_weight, resting_weight)
+
+    Returns:
+        (N, 5) array with columns [activity_score, step_score, sleep_score,
+        training_score, resting_score]
+    """
+    scores = np.empty((len(metrics), 5))
+    for i in range(len(metrics)):
+        scores[i] = _score_day(metrics[i, 0], metrics[i, 1], metrics[i, 2], metrics[i, 3],
+                               params[i], weights)
+    return scores
+
+
 class ActivityScoreSettings(BaseModel):
     """Configuration settings for Activity Score algorithm"""
 
@@ -59,8 +188,27 @@ class ActivityScore(BaseAlgorithm):
     _version = "0.1.0"
 
     def __init__(self, settings: ActivityScoreSettings = ActivityScoreSettings()) -> None:
+        super().__init__()
         self.settings = settings
         self._validate_weights()
+        # Bind the settings read by the scoring paths to plain floats once,
+        # so hot calls skip the pydantic attribute access machinery
+        self._weights = (float(settings.step_weight),
+                         float(settings.sleep_weight),
+                         float(settings.training_weight),
+                         float(settings.resting_weight))
+        self._gaussian = settings.scoring_method == "gaussian"
+        self._default_params = (float(settings.baseline_daily_steps),
+                                float(settings.step_ceiling),
+                                self._gaussian,
+                                float(settings.min_sleep_hours),
+                                float(settings.optimal_sleep_hours),
+                                float(settings.max_sleep_hours),
+                                float(settings.optimal_training_minutes),
+                                float(settings.max_training_minutes),
+                                settings.min_resting_minutes / 60,
+                                settings.optimal_resting_minutes / 60,
+                                settings.max_resting_minutes / 60)
         self.user_stats = None
         self.daily_scores = None
         self.baseline_stats = None
@@ -99,127 +247,50 @@ class ActivityScore(BaseAlgorithm):
             'resting_std': baseline_data['resting_minutes'].std()
         }
 
-    def _score_steps(self, daily_steps: int, baseline_stats: dict = None) -> float:
+    def _resolve_scoring_params(self, baseline_stats: dict = None) -> tuple:
         """
-        Score daily step count (0-100).
-
-        Gaussian distribution centered at user's median baseline.
-        """
-        if baseline_stats is None:
-            baseline = self.settings.baseline_daily_steps
-            ceiling = self.settings.step_ceiling
-        else:
-            # Use personalized baseline from historical data
-            baseline = baseline_stats['steps_median']
-            # Ceiling is 75th percentile or 1.5x median, whichever is higher
-            ceiling = max(baseline * 1.5, baseline_stats['steps_p75'])
-
-        if self.settings.scoring_method == "gaussian":
-            if baseline == 0:
-                return 0.0
-            normalized = daily_steps / baseline
-            peak_normalized = ceiling / baseline
-            std_dev = (peak_normalized - 1.0) / 2.0
-            score = 100 * np.exp(-((normalized - 1.0) ** 2) / (2 * std_dev ** 2))
-            score = np.clip(score, 0, 100)
-        else:
-            if ceiling == 0:
-                return 0.0
-            score = min(100, (daily_steps / ceiling) * 100)
-
-        return float(score)
-
-    def _score_sleep(self, sleep_hours: float, baseline_stats: dict = None) -> float:
-        """
-        Score sleep duration (0-100).
-
-        Centered at user's median sleep, with personalized thresholds.
-        """
-        if baseline_stats is None:
-            optimal = self.settings.optimal_sleep_hours
-            min_sleep = self.settings.min_sleep_hours
-            max_sleep = self.settings.max_sleep_hours
-        else:
-            median_sleep = baseline_stats['sleep_median']
-            std_sleep = baseline_stats['sleep_std'] or 0.5
-            optimal = median_sleep
-            min_sleep = max(4.0, median_sleep - std_sleep * 1.5)
-            max_sleep = min(11.0, median_sleep + std_sleep * 1.5)
-
-        if sleep_hours < min_sleep:
-            deficit = (min_sleep - sleep_hours) / min_sleep
-            score = max(0, 50 - deficit * 50)
-        elif sleep_hours <= optimal:
-            score = ((sleep_hours - min_sleep) / (optimal - min_sleep)) * 100
-        elif sleep_hours <= max_sleep:
-            score = 100 - ((sleep_hours - optimal) / (max_sleep - optimal)) * 30
-        else:
-            excess = sleep_hours - max_sleep
-            score = max(0, 70 - excess * 10)
-
-        return float(np.clip(score, 0, 100))
-
-    def _score_training(self, training_minutes: int, baseline_stats: dict = None) -> float:
-        """
-        Score training time (0-100).
-
-        Rewards consistent moderate training relative to user's baseline.
-        """
-        if baseline_stats is None:
-            optimal = self.settings.optimal_training_minutes
-            max_train = self.settings.max_training_minutes
-        else:
-            median_training = baseline_stats['training_median']
-            std_training = baseline_stats['training_std'] or 15
-            optimal = max(30, median_training)
-            max_train = optimal + std_training * 2
-
-        if training_minutes < 5:
-            score = 50
-        elif training_minutes <= optimal:
-            score = 50 + (training_minutes / optimal) * 50
-        elif training_minutes <= max_train:
-            excess_ratio = (training_minutes - optimal) / (max_train - optimal)
-            score = 100 + (excess_ratio * 10) - 10
-        else:
-            excess = training_minutes - max_train
-            score = max(0, 100 - excess * 0.5)
+        Resolve the thresholds used by the scoring kernels, either from the
+        personalized baseline statistics or from the configured defaults.
 
-        return float(np.clip(score, 0, 100))
-
-    def _score_resting(self, resting_minutes: int, baseline_stats: dict = None) -> float:
-        """
-        Score resting/recovery time (0-100).
+        Args:
+            baseline_stats: Dictionary from `_compute_baseline_stats`, or None
 
-        Rewards recovery relative to user's baseline.
+        Returns:
+            Flat tuple of thresholds consumed by `_score_day`
         """
-        resting_hours = resting_minutes / 60
-
         if baseline_stats is None:
-            optimal_hours = self.settings.optimal_resting_minutes / 60
-            min_hours = self.settings.min_resting_minutes / 60
-            max_hours = self.settings.max_resting_minutes / 60
-        else:
-            median_resting = baseline_stats['resting_median'] / 60
-            std_resting = baseline_stats['resting_std'] / 60 or 0.5
-            optimal_hours = median_resting
-            min_hours = max(6.0, median_resting - std_resting * 1.5)
-            max_hours = min(12.0, median_resting + std_resting * 1.5)
-
-        if resting_hours < min_hours:
-            deficit = (min_hours - resting_hours)
-            score = max(0, 50 - deficit * 15)
-        elif resting_hours <= optimal_hours:
-            score = ((resting_hours - min_hours) / (optimal_hours - min_hours)) * 100
-        elif resting_hours <= max_hours:
-            excess_hours = resting_hours - optimal_hours
-            max_excess = max_hours - optimal_hours
-            score = 100 - (excess_hours / max_excess) * 25
-        else:
-            excess_hours = resting_hours - max_hours
-            score = max(0, 75 - excess_hours * 10)
-
-        return float(np.clip(score, 0, 100))
+            return self._default_params
+
+        # Use personalized baselines from historical data
+        step_baseline = baseline_stats['steps_median']
+        # Ceiling is 75th percentile or 1.5x median, whichever is higher
+        step_ceiling = max(step_baseline * 1.5, baseline_stats['steps_p75'])
+
+        median_sleep = baseline_stats['sleep_median']
+        std_sleep = baseline_stats['sleep_std'] or 0.5
+        sleep_opt = median_sleep
+        sleep_min = max(4.0, median_sleep - std_sleep * 1.5)
+        sleep_max = min(11.0, median_sleep + std_sleep * 1.5)
+
+        median_training = baseline_stats['training_median']
+        std_training = baseline_stats['training_std'] or 15
+        train_opt = max(30, median_training)
+        train_max = train_opt + std_training * 2
+
+        median_resting = baseline_stats['resting_median'] / 60
+        std_resting = baseline_stats['resting_std'] / 60 or 0.5
+        rest_opt_h = median_resting
+        rest_min_h = max(6.0, median_resting - std_resting * 1.5)
+        rest_max_h = min(12.0, median_resting + std_resting * 1.5)
+
+        return (step_baseline, step_ceiling, self._gaussian,
+                sleep_min, sleep_opt, sleep_max,
+                train_opt, train_max,
+                rest_min_h, rest_opt_h, rest_max_h)
+
+    def _score_weights(self) -> tuple:
+        """Factor weights as a flat tuple for the scoring kernel."""
+        return self._weights
 
     def run(self, daily_activity_data: DataFrame):
         """
@@ -256,17 +327,13 @@ class ActivityScore(BaseAlgorithm):
         self.baseline_stats = self._compute_baseline_stats(baseline_data)
 
         # Calculate individual scores using personalized baselines
-        step_score = self._score_steps(current_day_data['steps'], self.baseline_stats)
-        sleep_score = self._score_sleep(current_day_data['sleep_hours'], self.baseline_stats)
-        training_score = self._score_training(current_day_data['training_minutes'], self.baseline_stats)
-        resting_score = self._score_resting(current_day_data['resting_minutes'], self.baseline_stats)
-
-        # Weighted combination
-        activity_score = (
-            (step_score * self.settings.step_weight) +
-            (sleep_score * self.settings.sleep_weight) +
-            (training_score * self.settings.training_weight) +
-            (resting_score * self.settings.resting_weight)
+        activity_score, step_score, sleep_score, training_score, resting_score = _score_day(
+            current_day_data['steps'],
+            current_day_data['sleep_hours'],
+            current_day_data['training_minutes'],
+            current_day_data['resting_minutes'],
+            self._resolve_scoring_params(self.baseline_stats),
+            self._score_weights()
         )
 
         # Create output DataFrame
@@ -285,7 +352,110 @@ class ActivityScore(BaseAlgorithm):
         }
 
         self.biomarker = DataFrame([score_record])
-        self.daily_scores = self.biomarker.copy()
+        self.daily_scores = self.biomarker
+
+        return self
+
+    def run_history(self, daily_activity_data: DataFrame):
+        """
+        Calculate Activity Scores for every day in a history (backfill).
+
+        Rolling baselines (median, std, 75th percentile) are computed in a
+        single vectorized pandas pass over the full history instead of
+        re-slicing and re-reducing the baseline window for each day, and the
+        per-day scores are rounded array-wide at the end rather than one
+        Python float at a time.
+
+        Args:
+            daily_activity_data: DataFrame with the same columns required by
+                `run`, sorted by date (oldest to newest).
+
+        Returns:
+            self with daily_scores containing one score row per day starting
+            from the second day (the first day has no baseline)
+        """
+        cols = ['steps', 'sleep_hours', 'training_minutes', 'resting_minutes']
+        if not all(col in daily_activity_data.columns for col in cols):
+            raise ValueError("DataFrame must contain: steps, sleep_hours, training_minutes, resting_minutes")
+
+        if len(daily_activity_data) < 2:
+            raise ValueError(f"Need at least 2 days of data, got {len(daily_activity_data)}")
+
+        window = self.settings.baseline_window_days
+        history = daily_activity_data[cols]
+
+        # Rolling baselines over the previous days only (hence the shift),
+        # matching the baseline_data slice used by run
+        med = history.rolling(window, min_periods=1).median().shift(1)
+        std = history.rolling(window, min_periods=1).std().shift(1)
+        steps_p75 = history['steps'].rolling(window, min_periods=1).quantile(0.75).shift(1)
+
+        n_days = len(daily_activity_data)
+        med_arr = med.to_numpy()
+        std_arr = std.to_numpy()
+        p75_arr = steps_p75.to_numpy()
+
+        params = []
+        for i in range(1, n_days):
+            baseline_stats = {
+                'steps_median': med_arr[i, 0],
+                'steps_std': std_arr[i, 0],
+                'steps_p75': p75_arr[i],
+                'sleep_median': med_arr[i, 1],
+                'sleep_std': std_arr[i, 1],
+                'training_median': med_arr[i, 2],
+                'training_std': std_arr[i, 2],
+                'resting_median': med_arr[i, 3],
+                'resting_std': std_arr[i, 3]
+            }
+            params.append(self._resolve_scoring_params(baseline_stats))
+
+        scores = _score_batch(history.to_numpy(dtype=float)[1:], params, self._score_weights())
+
+        dates = (daily_activity_data['date'].iloc[1:].values
+                 if 'date' in daily_activity_data.columns
+                 else daily_activity_data.index[1:])
+
+        self.daily_scores = DataFrame({
+            'date': dates,
+            'activity_score': np.round(scores[:, 0], 1),
+            'step_score': np.round(scores[:, 1], 1),
+            'sleep_score': np.round(scores[:, 2], 1),
+            'training_score': np.round(scores[:, 3], 1),
+            'resting_score': np.round(scores[:, 4], 1),
+            'steps': history['steps'].iloc[1:].values,
+            'sleep_hours': history['sleep_hours'].iloc[1:].values,
+            'training_minutes': history['training_minutes'].iloc[1:].values,
+            'resting_minutes': history['resting_minutes'].iloc[1:].values,
+            'baseline_days_used': np.minimum(np.arange(1, n_days), window)
+        })
+        self.biomarker = self.daily_scores
+
+        return self
+
+    def run_batch(self, histories: dict):
+        """
+        Calculate Activity Scores for multiple users in one call.
+
+        Each user's history is scored through the batched run_history path;
+        the per-user results are concatenated into a single DataFrame with a
+        'user' column.
+
+        Args:
+            histories: Mapping of user identifier to a daily activity
+                DataFrame accepted by `run_history`.
+
+        Returns:
+            self with daily_scores containing the per-day scores of every user
+        """
+        if not histories:
+            raise ValueError("histories must contain at least one user")
+
+        frames = [self.run_history(history).daily_scores.assign(user=user)
+                  for user, history in histories.items()]
+
+        self.daily_scores = concat(frames, ignore_index=True)
+        self.biomarker = self.daily_scores
 
         return self
 
@@ -1,4 +1,5 @@
-from pandas import Series, DataFrame
+from numpy import maximum
+from pandas import DataFrame
 from pydantic import BaseModel, Field, PositiveInt
 
 from physiodsp.base import BaseAlgorithm
@@ -21,6 +22,7 @@ class ENMO(BaseAlgorithm):
     def __init__(self,
                  settings: ENMOSettings = ENMOSettings()
                  ) -> None:
+        super().__init__()
         self.settings = settings
         self._window_len = settings.window_len
         self._aggregation_window = settings.aggregation_window
@@ -40,26 +42,20 @@ class ENMO(BaseAlgorithm):
         """
 
         enmo = accelerometer.magnitude - 1
-        enmo[enmo < 0] = 0
-
-        self.timestamps = Series(accelerometer.timestamps).rolling(
-            window=int(self._window_len * accelerometer.fs),
-            step=int(self._window_len * accelerometer.fs),
-            min_periods=int(self._window_len * accelerometer.fs),
-            closed="left"
-        ).max()[1:]
-
-        self.values = Series(enmo).rolling(
-            window=int(self._window_len * accelerometer.fs),
-            step=int(self._window_len * accelerometer.fs),
-            min_periods=int(self._window_len * accelerometer.fs),
-            closed="left"
-        ).mean()[1:]
-
-        self.biomarker = DataFrame(
-            list(zip(self.timestamps, self.values)),
-            columns=['timestamps', 'values']
-        )
+        maximum(enmo, 0, out=enmo)
+
+        # Average over non-overlapping windows via reshape instead of a
+        # pandas rolling pass; only complete windows are kept
+        window = self._window_samples(accelerometer.fs)
+        n_windows = (len(enmo) - 1) // window
+
+        self.timestamps = accelerometer.timestamps[window - 1::window][:n_windows]
+        self.values = enmo[:n_windows * window].reshape(n_windows, window).mean(axis=1)
+
+        self.biomarker = DataFrame({
+            'timestamps': self.timestamps,
+            'values': self.values
+        })
 
         return self
 
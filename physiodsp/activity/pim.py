@@ -20,15 +20,19 @@ class PIMAlgorithm(BaseAlgorithm):
     def __init__(self,
                  settings: PIMSettings = PIMSettings()
                  ) -> None:
+        super().__init__()
         self.settings = settings
         self._aggregation_window = settings.aggregation_window
         return None
 
     def run(self, data: IMUData):
         self.data = data
-        self.values_x = abs(data.x)
-        self.values_y = abs(data.y)
-        self.values_z = abs(data.z)
+        # Single pass over the contiguous (N, 3) matrix instead of one
+        # abs call per axis
+        self.values = abs(data.to_matrix())
+        self.values_x = self.values[:, 0]
+        self.values_y = self.values[:, 1]
+        self.values_z = self.values[:, 2]
 
         # Raw biomarker: combine absolute values for raw signal representation
         self.biomarker = DataFrame({
@@ -44,12 +48,11 @@ class PIMAlgorithm(BaseAlgorithm):
                   method: str = 'sum'
                   ):
 
-        df = self.biomarker.copy()
-
-        df['timestamps'] = (df['timestamps'] // self.aggregation_window) * self.aggregation_window
-
-        df_agg = df.groupby('timestamps')[["x", "y", "z"]].agg(method).reset_index(drop=False)
-
-        self.biomarker_agg = df_agg
+        self.biomarker_agg = self._bucket_aggregate_matrix(
+            self.data.timestamps,
+            self.values,
+            ('x', 'y', 'z'),
+            method
+        )
 
         return self
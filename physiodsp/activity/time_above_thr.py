@@ -1,8 +1,7 @@
-from numpy import abs, concatenate
-from pandas import DataFrame
+from numpy import abs, bool_, column_stack, empty, greater_equal, int64, uint8
 from pydantic import BaseModel, Field, PositiveInt, PositiveFloat
 
-from physiodsp.base import BaseAlgorithm
+from physiodsp.base import BaseAlgorithm, RollingResult
 from physiodsp.sensors.imu.base import IMUData
 
 
@@ -24,24 +23,46 @@ class TimeAboveThr(BaseAlgorithm):
     def __init__(self,
                  settings: TimeAboveThrSettings = TimeAboveThrSettings()
                  ) -> None:
+        super().__init__()
         self.settings = settings
         self._window_len = settings.window_len
         self._aggregation_window = settings.aggregation_window
+        # Scratch buffers reused across run calls so the abs/compare chain
+        # does not allocate signal-sized temporaries every time
+        self._abs_scratch = None
+        self._mask_scratch = None
         return None
 
+    def __scratch(self, shape, dtype):
+        """Grow-only scratch buffers keyed on the input shape"""
+        if self._abs_scratch is None or self._abs_scratch.shape[0] < shape[0] \
+                or self._abs_scratch.dtype != dtype:
+            self._abs_scratch = empty(shape, dtype=dtype)
+            self._mask_scratch = empty(shape, dtype=bool_)
+
+        return self._abs_scratch[:shape[0]], self._mask_scratch[:shape[0]]
+
     def run(self, data: IMUData):
 
         imu_matrix = data.to_matrix()
-        above_thr = (abs(imu_matrix) >= self.settings.threshold).astype(int)
-        # Add timestamp column
-        above_thr = concatenate([data.timestamps.reshape(-1, 1), above_thr], axis=1)
-
-        self.biomarker = DataFrame({"timestamps": above_thr[:, 0], "x": above_thr[:, 1], "y": above_thr[:, 2], "z": above_thr[:, 3]}).rolling(
-            window=int(self._window_len * data.fs),
-            step=int(self._window_len * data.fs),
-            min_periods=int(self._window_len * data.fs),
-            closed="left"
-        ).agg({"timestamps": "max", "x": "sum", "y": "sum", "z": "sum"})[1:]
+        abs_buf, mask = self.__scratch(imu_matrix.shape, imu_matrix.dtype)
+        abs(imu_matrix, out=abs_buf)
+        greater_equal(abs_buf, self.settings.threshold, out=mask)
+        above_thr = mask.view(uint8)
+
+        # Count samples above threshold over non-overlapping windows via
+        # reshape instead of a pandas rolling pass; only complete windows
+        # are kept and timestamps never enter the mask matrix
+        window = self._window_samples(data.fs)
+        n_windows = (len(above_thr) - 1) // window
+        counts = above_thr[:n_windows * window].reshape(n_windows, window, 3).sum(axis=1, dtype=int64)
+
+        self.biomarker = RollingResult(
+            timestamps=data.timestamps[window - 1::window][:n_windows],
+            x=counts[:, 0],
+            y=counts[:, 1],
+            z=counts[:, 2]
+        )
 
         return self
 
@@ -49,12 +70,13 @@ class TimeAboveThr(BaseAlgorithm):
                   method: str = 'sum'
                   ):
 
-        df = self.biomarker.copy()
-
-        df['timestamps'] = (df['timestamps'] // self.aggregation_window) * self.aggregation_window
-
-        df_agg = df.groupby('timestamps')[["x", "y", "z"]].agg(method).reset_index(drop=False)
+        result = self.biomarker
 
-        self.biomarker_agg = df_agg
+        self.biomarker_agg = self._bucket_aggregate_matrix(
+            result.timestamps,
+            column_stack((result.x, result.y, result.z)),
+            ('x', 'y', 'z'),
+            method
+        )
 
         return self
@@ -1,9 +1,8 @@
-from numpy import diff, abs
-from pandas import DataFrame
+from numpy import ascontiguousarray, bitwise_count, column_stack, float32, int64, packbits, uint8
 from pydantic import BaseModel, Field, PositiveInt, PositiveFloat
 from scipy.signal import butter, sosfilt, sosfilt_zi
 
-from physiodsp.base import BaseAlgorithm
+from physiodsp.base import BaseAlgorithm, RollingResult
 from physiodsp.sensors.imu.base import IMUData
 
 
@@ -32,12 +31,41 @@ class ZeroCrossing(BaseAlgorithm):
                  settings: ZeroCrossingSettings = ZeroCrossingSettings(),
                  ) -> None:
 
+        super().__init__()
         self.settings = settings
         self._window_len = settings.window_len
         self._aggregation_window = settings.aggregation_window
         self.zero_crossing_thr = settings.zero_crossing_thr
+        # Filter design depends only on the sampling frequency, so cache
+        # the coefficients and initial state per fs across run calls
+        self._filter_cache = {}
         return None
 
+    def __design_filter(self, fs: int):
+        """
+        Design (and cache) the bandpass Butterworth filter for a sampling
+        frequency.
+
+        Args:
+            fs: Sampling frequency of the IMU data in Hz
+
+        Returns:
+            Tuple (sos, zi) with the second-order sections and the per-axis
+            initial state template
+        """
+        if fs not in self._filter_cache:
+            sos = butter(self.settings.filter_order,
+                         [self.settings.filter_low_freq, self.settings.filter_high_freq],
+                         btype='band',
+                         fs=fs,
+                         output='sos')
+            # Design in float64 for accuracy, then downcast: float32 is
+            # ample for accelerometer data feeding a threshold comparison
+            self._filter_cache[fs] = (sos.astype(float32),
+                                      sosfilt_zi(sos)[:, :, None].astype(float32))
+
+        return self._filter_cache[fs]
+
     def __preprocess_imu(self, imu_matrix, fs: int):
         """
         Apply bandpass Butterworth filter to IMU data.
@@ -51,20 +79,14 @@ class ZeroCrossing(BaseAlgorithm):
         Returns:
             Filtered (N, 3) array
         """
-        # Design bandpass filter using second-order sections for numerical stability
-        sos = butter(self.settings.filter_order,
-                     [self.settings.filter_low_freq, self.settings.filter_high_freq],
-                     btype='band',
-                     fs=fs,
-                     output='sos')
-
-        # Initialize filter states for each axis
-        zi = sosfilt_zi(sos)
+        # Bandpass filter designed with second-order sections for numerical
+        # stability, cached per sampling frequency
+        sos, zi = self.__design_filter(fs)
 
-        # Apply filter to each axis using sosfilt (not filtfilt)
-        filtered_matrix = imu_matrix.copy()
-        for i in range(imu_matrix.shape[1]):
-            filtered_matrix[:, i], _ = sosfilt(sos, imu_matrix[:, i], zi=zi * imu_matrix[0, i])
+        # Apply filter to all axes in a single vectorized call (not
+        # filtfilt), broadcasting the initial state to one state per axis
+        imu_matrix = ascontiguousarray(imu_matrix, dtype=float32)
+        filtered_matrix, _ = sosfilt(sos, imu_matrix, axis=0, zi=zi * imu_matrix[0])
 
         return filtered_matrix
 
@@ -73,17 +95,28 @@ class ZeroCrossing(BaseAlgorithm):
         # Apply bandpass filter to IMU data
         imu_matrix = data.to_matrix()
         imu_matrix_filtered = self.__preprocess_imu(imu_matrix, fs=data.fs)
-        # Compute zero crossings for each axis
-        zcr = abs(diff((imu_matrix_filtered >= self.zero_crossing_thr).astype(int), axis=0))
-
-        self.values = DataFrame({"timestamps": data.timestamps[1:], "x": zcr[:, 0], "y": zcr[:, 1], "z": zcr[:, 2]}).rolling(
-            window=int(self._window_len * data.fs),
-            step=int(self._window_len * data.fs),
-            min_periods=int(self._window_len * data.fs),
-            closed="left"
-        ).agg({"timestamps": "max", "x": "sum", "y": "sum", "z": "sum"})[1:]
-
-        self.biomarker = self.values.copy()
+        # Compute zero crossings for each axis: a crossing is a change in
+        # the threshold indicator between consecutive samples, which for a
+        # boolean mask is a bitwise XOR of adjacent rows
+        above_thr = imu_matrix_filtered >= self.zero_crossing_thr
+        zcr = (above_thr[1:] ^ above_thr[:-1]).view(uint8)
+
+        # Count crossings per non-overlapping window by packing the crossing
+        # bits (8 samples per byte, zero-padded at window boundaries) and
+        # popcounting the packed words; only complete windows are kept
+        window = self._window_samples(data.fs)
+        n_windows = (len(zcr) - 1) // window
+        packed = packbits(zcr[:n_windows * window].reshape(n_windows, window, 3), axis=1)
+        counts = bitwise_count(packed).sum(axis=1, dtype=int64)
+
+        self.values = RollingResult(
+            timestamps=data.timestamps[window::window][:n_windows],
+            x=counts[:, 0],
+            y=counts[:, 1],
+            z=counts[:, 2]
+        )
+
+        self.biomarker = self.values
 
         return self
 
@@ -91,12 +124,13 @@ class ZeroCrossing(BaseAlgorithm):
                   method: str = 'sum'
                   ):
 
-        df = self.values.copy()
-
-        df['timestamps'] = (df['timestamps'] // self.aggregation_window) * self.aggregation_window
-
-        df_agg = df.groupby('timestamps')[["x", "y", "z"]].agg(method).reset_index(drop=False)
+        result = self.values
 
-        self.biomarker_agg = df_agg
+        self.biomarker_agg = self._bucket_aggregate_matrix(
+            result.timestamps,
+            column_stack((result.x, result.y, result.z)),
+            ('x', 'y', 'z'),
+            method
+        )
 
         return self
@@ -23,6 +23,7 @@ class Sway(BaseAlgorithm):
     _version = "0.1.0"
 
     def __init__(self, settings: SwaySettings = SwaySettings()) -> None:
+        super().__init__()
         self.settings = settings
         return None
 
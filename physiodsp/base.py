@@ -1,6 +1,40 @@
 from abc import ABC
-from pandas import DataFrame
-from numpy import ndarray
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+from numpy import add, append, asarray, bincount, diff, flatnonzero, float64, int64, ndarray
+
+if TYPE_CHECKING:
+    from pandas import DataFrame
+
+
+@dataclass(slots=True)
+class RollingResult:
+    """
+    Windowed per-axis values held as plain numpy arrays.
+
+    Supports the common frame-style accesses (column membership, len,
+    bracket indexing) without paying DataFrame construction on every run;
+    use to_pandas() where actual pandas semantics are needed.
+    """
+
+    timestamps: ndarray
+    x: ndarray
+    y: ndarray
+    z: ndarray
+
+    columns = ('timestamps', 'x', 'y', 'z')
+
+    def __getitem__(self, name: str) -> ndarray:
+        return getattr(self, name)
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def to_pandas(self) -> "DataFrame":
+        """Materialize the result as a pandas DataFrame"""
+        from pandas import DataFrame
+
+        return DataFrame({'timestamps': self.timestamps, 'x': self.x, 'y': self.y, 'z': self.z})
 
 
 class BaseAlgorithm(ABC):
@@ -12,6 +46,7 @@ class BaseAlgorithm(ABC):
     _aggregation_window = 60
 
     def __init__(self) -> None:
+        self._window_samples_cache = {}
         return None
 
     @property
@@ -34,29 +69,116 @@ class BaseAlgorithm(ABC):
         """Aggregation Window in seconds"""
         return self._aggregation_window
 
+    def _window_samples(self, fs: int) -> int:
+        """Processing window length in samples, cached per sampling frequency"""
+        if fs not in self._window_samples_cache:
+            self._window_samples_cache[fs] = int(self._window_len * fs)
+        return self._window_samples_cache[fs]
+
     def preprocess(self):
         raise NotImplementedError
 
     def run(self):
         raise NotImplementedError
 
+    def _bucket_aggregate(self,
+                          timestamps: ndarray,
+                          columns: dict,
+                          method: str = 'mean'
+                          ) -> "DataFrame":
+        """
+        Aggregate columns over fixed aggregation windows with np.bincount.
+
+        Timestamps are bucketed to multiples of the aggregation window and
+        each column is reduced per bucket through a single C-level bincount
+        pass, avoiding the pandas groupby hash table. Empty buckets are
+        dropped, matching the previous groupby behaviour.
+
+        Args:
+            timestamps: Timestamps in seconds, one per row
+            columns: Mapping of column name to values array
+            method: Reduction to apply, either 'sum' or 'mean'
+
+        Returns:
+            DataFrame: One row per occupied bucket with the bucketed
+                timestamps and the reduced columns
+        """
+        # Imported here so algorithms that never aggregate (e.g. the HRV
+        # score) do not pay the pandas import cost
+        from pandas import DataFrame
+
+        if method not in ('sum', 'mean'):
+            raise ValueError(f"Unsupported aggregation method: {method}")
+
+        bucket = (asarray(timestamps) // self._aggregation_window).astype(int64)
+        offset = bucket.min() if bucket.size else 0
+        bucket -= offset
+
+        counts = bincount(bucket)
+        occupied = flatnonzero(counts)
+
+        data = {'timestamps': ((occupied + offset) * self._aggregation_window).astype(float64)}
+        for name, values in columns.items():
+            reduced = bincount(bucket, weights=values)[occupied]
+            if method == 'mean':
+                reduced /= counts[occupied]
+            data[name] = reduced
+
+        return DataFrame(data)
+
+    def _bucket_aggregate_matrix(self,
+                                 timestamps: ndarray,
+                                 matrix: ndarray,
+                                 names: tuple,
+                                 method: str = 'sum'
+                                 ) -> "DataFrame":
+        """
+        Aggregate a (M, C) matrix over fixed aggregation windows at once.
+
+        Multi-column variant of `_bucket_aggregate`: all columns are
+        reduced in a single np.add.reduceat call on bucket-boundary
+        indices, instead of one bincount pass per column. Empty buckets
+        cannot occur by construction (only occupied buckets have
+        boundaries), matching the single-column variant.
+
+        Args:
+            timestamps: Timestamps in seconds, one per row
+            matrix: (M, C) values, one column per output column
+            names: Output column name per matrix column
+            method: Reduction to apply, either 'sum' or 'mean'
+
+        Returns:
+            DataFrame: One row per occupied bucket with the bucketed
+                timestamps and the reduced columns
+        """
+        from pandas import DataFrame
+
+        if method not in ('sum', 'mean'):
+            raise ValueError(f"Unsupported aggregation method: {method}")
+
+        bucket = (asarray(timestamps) // self._aggregation_window).astype(int64)
+        starts = append(0, flatnonzero(diff(bucket)) + 1)
+
+        reduced = add.reduceat(matrix, starts, axis=0).astype(float64)
+        if method == 'mean':
+            sizes = diff(append(starts, len(bucket)))
+            reduced /= sizes[:, None]
+
+        data = {'timestamps': (bucket[starts] * self._aggregation_window).astype(float64)}
+        for i, name in enumerate(names):
+            data[name] = reduced[:, i]
+
+        return DataFrame(data)
+
     def aggregate(self,
                   timestamps: ndarray,
                   values: ndarray,
                   method: str = 'mean'
                   ):
 
-        df = DataFrame({
-            'timestamps': timestamps,
-            'values': values
-        })
-
-        df['timestamps'] = df[
-            'timestamps'].apply(lambda x: (x // self._aggregation_window) * self._aggregation_window)
-
-        if method == 'mean':
-            df_agg = df.groupby('timestamps')[
-                'values'].mean().reset_index(drop=False)
-
-        self.biomarker_agg = df_agg
+        self.biomarker_agg = self._bucket_aggregate(
+            timestamps,
+            {'values': asarray(values)},
+            method
+        )
         return self
@@ -1,18 +1,138 @@
-from typing import Literal
+import math
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Literal
 import numpy as np
-from pandas import DataFrame
-from pydantic import BaseModel, Field, PositiveInt
-from scipy.stats import percentileofscore
+
+if TYPE_CHECKING:
+    from pandas import DataFrame
 
 from physiodsp.base import BaseAlgorithm
 from physiodsp.sensors.hrv import HrvData
 
-
-class HrvScoreSettings(BaseModel):
-
-    window_len: PositiveInt = Field(default=30, description="processing window length in days")
-
-    method: Literal["sigmoid", "percentile"] = Field(default="sigmoid", description="Method to map the HRV score in the 0-100 range")
+# Threshold tables for the trend bonus and stability penalty: a
+# searchsorted lookup is branchless and keeps working unchanged when the
+# kernel is later fed arrays instead of scalars. side='left' matches the
+# strict upper-bound comparisons of the original cascade; the lower bound
+# was strict the other way (trend < -0.05), so its threshold is nudged one
+# ulp down to keep trend == -0.05 in the zero-bonus bucket
+_TREND_THRESHOLDS = np.array([np.nextafter(-0.05, -np.inf), 0.05, 0.10])
+_TREND_BONUSES = np.array([-5, 0, 5, 10])
+_STAB_THRESHOLDS = np.array([0.10, 0.15])
+_STAB_PENALTIES = np.array([0, -5, -10])
+
+# tanh lookup table for the batched path: 1025 knots over [-8, 8] with
+# linear interpolation; tanh is saturated to +/-1 outside that range. The
+# scalar path keeps math.tanh, which is faster for single calls
+_TANH_LUT = np.tanh(np.linspace(-8.0, 8.0, 1025))
+_TANH_SCALE = 1024.0 / 16.0
+
+
+def _tanh_lut(x: np.ndarray) -> np.ndarray:
+    """Interpolated tanh of an array through the precomputed table"""
+    pos = np.clip((x + 8.0) * _TANH_SCALE, 0.0, 1024.0)
+    idx = np.minimum(pos.astype(np.int32), 1023)
+    frac = pos - idx
+    lo = _TANH_LUT[idx]
+    return lo + frac * (_TANH_LUT[idx + 1] - lo)
+
+
+def _hrv_score_kernel(current_rmssd: float, window: np.ndarray, use_sigmoid: bool) -> float:
+    """
+    Compute the 0-100 HRV score of a single day against its baseline window.
+
+    Scalar kernel shared by the scoring entry points: computes the baseline
+    statistics, maps the z-score to a base score (sigmoid or percentile),
+    then applies the trend bonus and the stability penalty. Callers pass a
+    contiguous float64 window, so the kernel could be JIT-compiled with an
+    explicit ``float64(float64, float64[::1], bool_)`` signature without
+    any further changes.
+
+    Args:
+        current_rmssd: Today's RMSSD value (ms)
+        window: RMSSD values of the baseline window, oldest to newest
+        use_sigmoid: Map the z-score through a sigmoid instead of using the
+            percentile rank within the window
+
+    Returns:
+        hrv_score: Score from 0-100
+    """
+    # Step 1: Baseline and variability. Sort a copy once and reuse it for
+    # the median and the percentile rank; the chronological window is kept
+    # for the trend step below
+    sorted_window = np.sort(window)
+    n = sorted_window.size
+    mid = n // 2
+    baseline = sorted_window[mid] if n % 2 else 0.5 * (sorted_window[mid - 1] + sorted_window[mid])
+    # Sum-of-squares identity: mean and variance from one sum and one dot
+    # product instead of the two-pass np.std. RMSSD values are all of the
+    # same magnitude, so the naive formula is numerically safe here
+    mean = sorted_window.sum() / n
+    std = math.sqrt(max(sorted_window @ sorted_window / n - mean * mean, 0.0))
+    cv = std / baseline if baseline > 0 else 0
+
+    # Step 2: Z-score
+    z_score = (current_rmssd - baseline) / std if std > 0 else 0
+
+    # Step 3: Map to 0-100
+    if use_sigmoid:
+        # math.tanh skips the ufunc dispatch overhead for a single float
+        base_score = 50.0 + 30.0 * math.tanh(0.5 * z_score)
+    else:
+        # Alternative: percentile method with rank semantics (ties average
+        # their percentage ranks, as scipy's percentileofscore does), found
+        # with two O(log n) lookups on the sorted buffer
+        left = np.searchsorted(sorted_window, current_rmssd, side='left')
+        right = np.searchsorted(sorted_window, current_rmssd, side='right')
+        base_score = (left + right + (right > left)) * 50.0 / n
+
+    # Step 4: Trend bonus
+    first_10_mean = window[:10].sum() / 10.0
+    last_10_mean = window[-10:].sum() / 10.0
+    trend = (last_10_mean - first_10_mean) / first_10_mean if first_10_mean > 0 else 0
+
+    trend_bonus = _TREND_BONUSES[np.searchsorted(_TREND_THRESHOLDS, trend, side='left')]
+
+    # Step 5: Stability penalty
+    stability_penalty = _STAB_PENALTIES[np.searchsorted(_STAB_THRESHOLDS, cv, side='left')]
+
+    # Final score
+    hrv_score = base_score + trend_bonus + stability_penalty
+    hrv_score = max(0.0, min(100.0, hrv_score))
+
+    return round(hrv_score)
+
+
+@dataclass
+class HrvScoreResult:
+    """Single-day HRV score, kept off pandas until a frame is requested"""
+
+    timestamp: float
+    hrv_score: float
+
+    def to_frame(self) -> "DataFrame":
+        """Materialize the result as a one-row pandas DataFrame"""
+        # Imported here so scoring alone never pays the pandas import cost
+        from pandas import DataFrame
+
+        return DataFrame({"timestamps": [self.timestamp], "hrv_score": [self.hrv_score]})
+
+
+@dataclass(frozen=True, slots=True)
+class HrvScoreSettings:
+    """HRV Score Algorithm Settings"""
+
+    window_len: int = 30
+    """processing window length in days"""
+
+    method: Literal["sigmoid", "percentile"] = "sigmoid"
+    """Method to map the HRV score in the 0-100 range"""
+
+    def __post_init__(self) -> None:
+        # Two manual checks replace the per-instance Pydantic validation
+        if self.window_len <= 0:
+            raise ValueError("window_len must be a positive integer")
+        if self.method not in ("sigmoid", "percentile"):
+            raise ValueError(f"Unsupported method: {self.method}")
 
 
 class HrvScore(BaseAlgorithm):
@@ -22,6 +142,7 @@ class HrvScore(BaseAlgorithm):
     _version = "0.1.0"
 
     def __init__(self, settings: HrvScoreSettings = HrvScoreSettings()) -> None:
+        super().__init__()
         self.settings = settings
         self._window_len = settings.window_len
         return None
@@ -30,7 +151,75 @@ class HrvScore(BaseAlgorithm):
 
         hrv_score = self._compute_hrv_score(data.values[-1], data.values[-self._window_len:-1])
 
-        self.biomarker_agg = DataFrame({"timestamps": data.timestamps[-1], "hrv_score": hrv_score})
+        # A plain result object keeps the hot path free of DataFrame
+        # construction; callers that need pandas use .to_frame()
+        self.biomarker_agg = HrvScoreResult(timestamp=data.timestamps[-1], hrv_score=hrv_score)
+
+        return self
+
+    def run_batch(self, data: HrvData):
+        """
+        Score every day of an HRV history in one vectorized pass.
+
+        Equivalent to calling `run` once per day with a growing history, but
+        the rolling baseline statistics are shared across days: window sums
+        come from two cumulative sums (O(N) instead of O(N*W)) and the
+        sigmoid/trend/stability stages are elementwise over all days.
+
+        Args:
+            data: HRV data with one RMSSD value per day, oldest to newest
+
+        Returns:
+            self with biomarker_agg holding one row per scored day
+        """
+        from pandas import DataFrame
+
+        values = data.values
+        # run scores values[i] against the window values[i-W:i]
+        w = self._window_len - 1
+        n = values.size
+        if n < self._window_len:
+            raise ValueError(
+                f"run_batch requires at least {self._window_len} daily values "
+                f"(one scored day plus its {w}-day baseline window), got {n}"
+            )
+        windows = np.lib.stride_tricks.sliding_window_view(values, w)[:n - w]
+        currents = values[w:]
+
+        # Rolling sums of values and squares through cumulative sums
+        c1 = np.concatenate(([0.0], np.cumsum(values)))
+        c2 = np.concatenate(([0.0], np.cumsum(values * values)))
+        s1 = c1[w:n] - c1[:n - w]
+        s2 = c2[w:n] - c2[:n - w]
+        mean = s1 / w
+        std = np.sqrt(np.maximum(s2 / w - mean * mean, 0.0))
+
+        baseline = np.median(windows, axis=1)
+        cv = np.divide(std, baseline, out=np.zeros_like(std), where=baseline > 0)
+        z_score = np.divide(currents - baseline, std, out=np.zeros_like(std), where=std > 0)
+
+        if self.settings.method == "sigmoid":
+            base_score = 50.0 + 30.0 * _tanh_lut(0.5 * z_score)
+        else:
+            # Rank semantics as in the scalar kernel: ties average their
+            # percentage ranks
+            less = np.count_nonzero(windows < currents[:, None], axis=1)
+            less_eq = np.count_nonzero(windows <= currents[:, None], axis=1)
+            base_score = (less + less_eq + (less_eq > less)) * 50.0 / w
+
+        first_10 = windows[:, :10].mean(axis=1)
+        last_10 = windows[:, -10:].mean(axis=1)
+        trend = np.divide(last_10 - first_10, first_10,
+                          out=np.zeros_like(first_10), where=first_10 > 0)
+
+        scores = base_score \
+            + _TREND_BONUSES[np.searchsorted(_TREND_THRESHOLDS, trend, side='left')] \
+            + _STAB_PENALTIES[np.searchsorted(_STAB_THRESHOLDS, cv, side='left')]
+
+        self.biomarker_agg = DataFrame({
+            "timestamps": data.timestamps[w:],
+            "hrv_score": np.rint(np.clip(scores, 0, 100)).astype(np.int64)
+        })
 
         return self
 
@@ -45,45 +234,6 @@ class HrvScore(BaseAlgorithm):
         Returns:
             hrv_score: Score from 0-100
         """
-        # Step 1: Baseline and variability
-        baseline = np.median(last_30_days_rmssd)
-        std = np.std(last_30_days_rmssd)
-        cv = std / baseline if baseline > 0 else 0
-
-        # Step 2: Z-score
-        z_score = (current_rmssd - baseline) / std if std > 0 else 0
-
-        # Step 3: Map to 0-100 using sigmoid
-        if self.settings.method in ["sigmoid"]:
-            base_score = 50 + 30 * np.tanh(0.5 * z_score)
-        else:
-            # Alternative: percentile method
-            base_score = percentileofscore(last_30_days_rmssd, current_rmssd)
-
-        # Step 4: Trend bonus
-        first_10_mean = np.mean(last_30_days_rmssd[:10])
-        last_10_mean = np.mean(last_30_days_rmssd[-10:])
-        trend = (last_10_mean - first_10_mean) / first_10_mean if first_10_mean > 0 else 0
-
-        if trend > 0.10:
-            trend_bonus = 10
-        elif trend > 0.05:
-            trend_bonus = 5
-        elif trend < -0.05:
-            trend_bonus = -5
-        else:
-            trend_bonus = 0
-
-        # Step 5: Stability penalty
-        if cv > 0.15:
-            stability_penalty = -10
-        elif cv > 0.10:
-            stability_penalty = -5
-        else:
-            stability_penalty = 0
-
-        # Final score
-        hrv_score = base_score + trend_bonus + stability_penalty
-        hrv_score = np.clip(hrv_score, 0, 100)
-
-        return round(hrv_score)
+        return _hrv_score_kernel(current_rmssd,
+                                 np.ascontiguousarray(last_30_days_rmssd, dtype=np.float64),
+                                 self.settings.method == "sigmoid")
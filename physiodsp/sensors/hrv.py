@@ -1,9 +1,15 @@
 from dataclasses import dataclass
 
-from numpy import array
+from numpy import array, ascontiguousarray, float64
 
 
-@dataclass
+@dataclass(slots=True)
 class HrvData:
     timestamps: array
     values: array
+
+    def __post_init__(self) -> None:
+        # Normalize at the boundary: contiguous float64 buffers keep every
+        # downstream slice and reduction on the stride-1 fast path
+        self.timestamps = ascontiguousarray(self.timestamps, dtype=float64)
+        self.values = ascontiguousarray(self.values, dtype=float64)
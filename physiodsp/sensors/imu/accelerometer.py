@@ -1,10 +1,7 @@
-from numpy import array
-
 from physiodsp.sensors.imu.base import IMUData
 
 
 class AccelerometerData(IMUData):
-    x: array
-    y: array
-    z: array
-    fs: int = 64
+    # Fields come from IMUData; an empty __slots__ keeps instances
+    # __dict__-free like the parent
+    __slots__ = ()
@@ -1,26 +1,72 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
-from numpy import array, sqrt, column_stack
+from numpy import array, einsum, empty, float32, sqrt
 
 
-@dataclass
+@dataclass(slots=True)
 class IMUData:
     timestamps: array
     x: array
     y: array
     z: array
     fs: int = 64
+    _magnitude: array = field(default=None, init=False, repr=False, compare=False)
+    _xyz: array = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Store the axes as one contiguous (N, 3) float32 block and
+        # re-expose x/y/z as zero-copy column views, so to_matrix and the
+        # matrix consumers never re-stack the data. float32 covers the
+        # dynamic range of IMU samples and halves the memory traffic;
+        # timestamps keep float64 for the seconds-since-epoch range.
+        self._xyz = empty((len(self.x), 3), dtype=float32)
+        self._xyz[:, 0] = self.x
+        self._xyz[:, 1] = self.y
+        self._xyz[:, 2] = self.z
+        self.x = self._xyz[:, 0]
+        self.y = self._xyz[:, 1]
+        self.z = self._xyz[:, 2]
+
+    @classmethod
+    def from_arrays_unchecked(cls, xyz: array, timestamps: array, fs: int = 64):
+        """
+        Wrap an existing (N, 3) matrix without validation or copying.
+
+        For internal pipelines whose buffers are already contiguous float32:
+        skips __init__/__post_init__ entirely, so the matrix is adopted
+        as-is and x/y/z become views into it.
+
+        Args:
+            xyz: Contiguous array of shape (N, 3) with columns [x, y, z]
+            timestamps: Timestamps in seconds, one per row
+            fs: Sampling frequency in Hz
+
+        Returns:
+            IMUData instance sharing the caller's buffers
+        """
+        obj = cls.__new__(cls)
+        obj.timestamps = timestamps
+        obj._xyz = xyz
+        obj.x = xyz[:, 0]
+        obj.y = xyz[:, 1]
+        obj.z = xyz[:, 2]
+        obj.fs = fs
+        obj._magnitude = None
+        return obj
 
     @property
     def magnitude(self) -> array:
-        """Inertial Measurement Unit Magnitude"""
-        return sqrt(self.x**2 + self.y**2 + self.z**2)
+        """Inertial Measurement Unit Magnitude, computed once and cached"""
+        if self._magnitude is None:
+            # Single fused pass over the contiguous matrix
+            self._magnitude = sqrt(einsum('ij,ij->i', self._xyz, self._xyz))
+        return self._magnitude
 
     def to_matrix(self) -> array:
         """
-        Converte the three axes into a (N, 3) numpy ndarray.
+        Return the three axes as a (N, 3) numpy ndarray.
 
         Returns:
             array: Array of shape (N, 3) with columns [x, y, z] where N is the number of samples
         """
-        return column_stack((self.x, self.y, self.z))
+        return self._xyz
@@ -0,0 +1,42 @@
+import math
+import os
+import time
+
+import pytest
+from numpy import arange, float64, load, save
+from pandas import read_csv
+
+test_folder_path = os.path.dirname(os.path.realpath(__file__))
+
+# One base timestamp for the whole session instead of a datetime.now()
+# syscall per test, aligned to the 60 s aggregation grid so a minute of
+# data always lands in a single aggregation bucket regardless of when the
+# suite runs
+TIMESTAMP_START = math.floor(time.time() / 60.0) * 60.0
+
+
+def make_timestamps(start, fs, n_samples):
+    """
+    Build exactly n_samples evenly spaced timestamps from start.
+
+    Uses an integer arange divided once by fs, which is exact, instead of a
+    float-step arange whose accumulated rounding can change the length.
+    """
+    return start + arange(n_samples, dtype=float64) / fs
+
+
+@pytest.fixture(scope="session")
+def accelerometer_data(tmp_path_factory):
+    """
+    Accelerometer test CSV as a memory-mapped (N, 3) array.
+
+    Parsed at most once per session into a temporary .npy file, then
+    memory-mapped read-only: slicing hands out zero-copy views served by
+    the page cache, and IMUData copies them once at construction.
+    """
+    npy_path = tmp_path_factory.getbasetemp() / "accelerometer.npy"
+    if not npy_path.exists():
+        df = read_csv(os.path.join(test_folder_path, "accelerometer.csv"), usecols=["x", "y", "z"])
+        save(npy_path, df[["x", "y", "z"]].to_numpy())
+
+    return load(npy_path, mmap_mode="r")
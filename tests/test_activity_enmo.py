@@ -1,14 +1,8 @@
-import os
 import pytest
-from datetime import datetime
-
-from numpy import arange
-from pandas import read_csv
 from physiodsp.sensors.imu.accelerometer import AccelerometerData
 from physiodsp.activity.enmo import ENMO
 
-
-test_folder_path = os.path.dirname(os.path.realpath(__file__))
+from tests.conftest import TIMESTAMP_START, make_timestamps
 
 
 @pytest.mark.parametrize(
@@ -19,18 +13,16 @@ test_folder_path = os.path.dirname(os.path.realpath(__file__))
             (256, 32)
         ]
 )
-def test_activity_enmo(n_samples, fs):
-
-    df = read_csv(os.path.join(test_folder_path, "accelerometer.csv"), usecols=["x", "y", "z"])
+def test_activity_enmo(accelerometer_data, n_samples, fs):
 
-    timestamp_start = datetime.now().timestamp()
-    timestamps = timestamp_start + arange(start=0, step=1/fs, stop=int(n_samples/fs))
+    timestamp_start = TIMESTAMP_START
+    timestamps = make_timestamps(timestamp_start, fs, n_samples)
 
     accelerometer = AccelerometerData(
         timestamps=timestamps,
-        x=df.x.values[:n_samples],
-        y=df.y.values[:n_samples],
-        z=df.z.values[:n_samples],
+        x=accelerometer_data[:n_samples, 0],
+        y=accelerometer_data[:n_samples, 1],
+        z=accelerometer_data[:n_samples, 2],
         fs=fs
     )
 
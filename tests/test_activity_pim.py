@@ -1,14 +1,10 @@
 
-import os
 import pytest
-from datetime import datetime
 from numpy import arange, ones, zeros
-from pandas import read_csv
 from physiodsp.sensors.imu.base import IMUData
 from physiodsp.activity.pim import PIMAlgorithm
 
-
-test_folder_path = os.path.dirname(os.path.realpath(__file__))
+from tests.conftest import TIMESTAMP_START, make_timestamps
 
 
 @pytest.mark.parametrize(
@@ -19,16 +15,15 @@ test_folder_path = os.path.dirname(os.path.realpath(__file__))
         (600, 100)
     ]
 )
-def test_pim_algorithm(n_samples, fs):
+def test_pim_algorithm(accelerometer_data, n_samples, fs):
     """Test PIM algorithm with various parameters"""
-    df = read_csv(os.path.join(test_folder_path, "accelerometer.csv"), usecols=["x", "y", "z"])
-    timestamp_start = datetime.now().timestamp()
-    timestamps = timestamp_start + arange(start=0, step=1/fs, stop=int(n_samples/fs))
+    timestamp_start = TIMESTAMP_START
+    timestamps = make_timestamps(timestamp_start, fs, n_samples)
     imu_data = IMUData(
         timestamps=timestamps,
-        x=df.x.values[:n_samples],
-        y=df.y.values[:n_samples],
-        z=df.z.values[:n_samples],
+        x=accelerometer_data[:n_samples, 0],
+        y=accelerometer_data[:n_samples, 1],
+        z=accelerometer_data[:n_samples, 2],
         fs=fs
     )
     pim = PIMAlgorithm()
@@ -48,8 +43,8 @@ def test_pim_absolute_values():
     """Test that PIM correctly computes absolute values"""
     n_samples = 64
     fs = 32
-    timestamp_start = datetime.now().timestamp()
-    timestamps = timestamp_start + arange(start=0, step=1/fs, stop=int(n_samples/fs))
+    timestamp_start = TIMESTAMP_START
+    timestamps = make_timestamps(timestamp_start, fs, n_samples)
     x_data = arange(-10, 10, 20/n_samples)
     y_data = arange(-5, 5, 10/n_samples)
     z_data = arange(-2, 2, 4/n_samples)
@@ -72,8 +67,8 @@ def test_pim_positive_values():
     """Test PIM with already positive values"""
     n_samples = 128
     fs = 32
-    timestamp_start = datetime.now().timestamp()
-    timestamps = timestamp_start + arange(start=0, step=1/fs, stop=int(n_samples/fs))
+    timestamp_start = TIMESTAMP_START
+    timestamps = make_timestamps(timestamp_start, fs, n_samples)
     x_data = ones(n_samples) * 0.5
     y_data = ones(n_samples) * 0.3
     z_data = ones(n_samples) * 0.7
@@ -96,8 +91,8 @@ def test_pim_zero_values():
     """Test PIM with zero values"""
     n_samples = 64
     fs = 32
-    timestamp_start = datetime.now().timestamp()
-    timestamps = timestamp_start + arange(start=0, step=1/fs, stop=int(n_samples/fs))
+    timestamp_start = TIMESTAMP_START
+    timestamps = make_timestamps(timestamp_start, fs, n_samples)
     x_data = zeros(n_samples)
     y_data = zeros(n_samples)
     z_data = zeros(n_samples)
@@ -124,16 +119,15 @@ def test_pim_algorithm_properties():
     assert pim._aggregation_window == 5
 
 
-def test_pim_estimate_returns_self():
+def test_pim_estimate_returns_self(accelerometer_data):
     """Test that estimate method returns self for method chaining"""
-    df = read_csv(os.path.join(test_folder_path, "accelerometer.csv"), usecols=["x", "y", "z"])
-    timestamp_start = datetime.now().timestamp()
-    timestamps = timestamp_start + arange(start=0, step=1/32, stop=4)
+    timestamp_start = TIMESTAMP_START
+    timestamps = make_timestamps(timestamp_start, 32, 128)
     imu_data = IMUData(
         timestamps=timestamps,
-        x=df.x.values[:128],
-        y=df.y.values[:128],
-        z=df.z.values[:128],
+        x=accelerometer_data[:128, 0],
+        y=accelerometer_data[:128, 1],
+        z=accelerometer_data[:128, 2],
         fs=32
     )
     pim = PIMAlgorithm()
@@ -145,8 +139,8 @@ def test_pim_data_preservation():
     """Test that original IMU data is not modified"""
     n_samples = 64
     fs = 32
-    timestamp_start = datetime.now().timestamp()
-    timestamps = timestamp_start + arange(start=0, step=1/fs, stop=int(n_samples/fs))
+    timestamp_start = TIMESTAMP_START
+    timestamps = make_timestamps(timestamp_start, fs, n_samples)
     x_data = arange(-10, 10, 20/n_samples)
     y_data = arange(-5, 5, 10/n_samples)
     z_data = arange(-2, 2, 4/n_samples)
@@ -172,8 +166,8 @@ def test_pim_mixed_values():
     """Test PIM with mixed positive and negative values"""
     n_samples = 100
     fs = 50
-    timestamp_start = datetime.now().timestamp()
-    timestamps = timestamp_start + arange(start=0, step=1/fs, stop=int(n_samples/fs))
+    timestamp_start = TIMESTAMP_START
+    timestamps = make_timestamps(timestamp_start, fs, n_samples)
     x_data = arange(-5, 5, 10/n_samples)
     y_data = arange(0, 10, 10/n_samples)
     z_data = arange(-10, 0, 10/n_samples)
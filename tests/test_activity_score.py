@@ -393,3 +393,33 @@ def test_activity_score_baseline_stats_stored():
     # Check that baseline stats make sense
     assert result.baseline_stats['steps_median'] > 0
     assert result.baseline_stats['sleep_median'] > 0
+
+
+def test_activity_score_run_history_matches_run():
+    """Test that run_history scores the last day exactly like run"""
+    np.random.seed(44)
+    settings = ActivityScoreSettings(baseline_window_days=15)
+
+    n_days = 25
+    dates = [datetime.now() - timedelta(days=x) for x in range(n_days, 0, -1)]
+    data = DataFrame({
+        'date': dates,
+        'steps': np.random.randint(6000, 12000, n_days).tolist(),
+        'sleep_hours': np.random.uniform(6.0, 9.0, n_days).tolist(),
+        'training_minutes': np.random.randint(20, 90, n_days).tolist(),
+        'resting_minutes': np.random.randint(450, 600, n_days).tolist()
+    })
+
+    history = ActivityScore(settings=settings).run_history(data)
+    single = ActivityScore(settings=settings).run(data)
+
+    assert len(history.daily_scores) == n_days - 1
+
+    last_row = history.daily_scores.iloc[-1]
+    run_row = single.biomarker.iloc[0]
+    for col in ['activity_score', 'step_score', 'sleep_score', 'training_score', 'resting_score']:
+        assert np.isclose(last_row[col], run_row[col]), f"Mismatch on {col}"
+
+    # Scores must stay in the 0-100 range for every day
+    assert (history.daily_scores['activity_score'] >= 0).all()
+    assert (history.daily_scores['activity_score'] <= 100).all()
@@ -1,14 +1,9 @@
-import os
 import pytest
-from datetime import datetime
-
-from numpy import arange, ones, zeros
-from pandas import read_csv
+from numpy import broadcast_to
 from physiodsp.sensors.imu.base import IMUData
 from physiodsp.activity.time_above_thr import TimeAboveThr, TimeAboveThrSettings
 
-
-test_folder_path = os.path.dirname(os.path.realpath(__file__))
+from tests.conftest import TIMESTAMP_START, make_timestamps
 
 
 @pytest.mark.parametrize(
@@ -19,19 +14,17 @@ test_folder_path = os.path.dirname(os.path.realpath(__file__))
             (256, 32, 0.05),
         ]
 )
-def test_activity_time_above_thr(n_samples, fs, threshold):
+def test_activity_time_above_thr(accelerometer_data, n_samples, fs, threshold):
     """Test TimeAboveThr algorithm with various parameters"""
 
-    df = read_csv(os.path.join(test_folder_path, "accelerometer.csv"), usecols=["x", "y", "z"])
-
-    timestamp_start = datetime.now().timestamp()
-    timestamps = timestamp_start + arange(start=0, step=1/fs, stop=int(n_samples/fs))
+    timestamp_start = TIMESTAMP_START
+    timestamps = make_timestamps(timestamp_start, fs, n_samples)
 
     imu_data = IMUData(
         timestamps=timestamps,
-        x=df.x.values[:n_samples],
-        y=df.y.values[:n_samples],
-        z=df.z.values[:n_samples],
+        x=accelerometer_data[:n_samples, 0],
+        y=accelerometer_data[:n_samples, 1],
+        z=accelerometer_data[:n_samples, 2],
         fs=fs
     )
 
@@ -61,13 +54,14 @@ def test_time_above_thr_all_above_threshold():
     fs = 32
     threshold = 0.01  # Very low threshold
 
-    timestamp_start = datetime.now().timestamp()
-    timestamps = timestamp_start + arange(start=0, step=1/fs, stop=int(n_samples/fs))
+    timestamp_start = TIMESTAMP_START
+    timestamps = make_timestamps(timestamp_start, fs, n_samples)
 
-    # Create data with values well above threshold
-    x_data = ones(n_samples) * 1.0
-    y_data = ones(n_samples) * 1.0
-    z_data = ones(n_samples) * 1.0
+    # Create data with values well above threshold; read-only broadcast
+    # views avoid materializing the constant arrays (IMUData copies once)
+    x_data = broadcast_to(1.0, n_samples)
+    y_data = broadcast_to(1.0, n_samples)
+    z_data = broadcast_to(1.0, n_samples)
 
     imu_data = IMUData(
         timestamps=timestamps,
@@ -94,13 +88,13 @@ def test_time_above_thr_all_below_threshold():
     fs = 32
     threshold = 10.0  # Very high threshold
 
-    timestamp_start = datetime.now().timestamp()
-    timestamps = timestamp_start + arange(start=0, step=1/fs, stop=int(n_samples/fs))
+    timestamp_start = TIMESTAMP_START
+    timestamps = make_timestamps(timestamp_start, fs, n_samples)
 
     # Create data with values well below threshold
-    x_data = zeros(n_samples)
-    y_data = zeros(n_samples)
-    z_data = zeros(n_samples)
+    x_data = broadcast_to(0.0, n_samples)
+    y_data = broadcast_to(0.0, n_samples)
+    z_data = broadcast_to(0.0, n_samples)
 
     imu_data = IMUData(
         timestamps=timestamps,
@@ -119,7 +113,7 @@ def test_time_above_thr_all_below_threshold():
     assert (tat_1s["z"] == 0).all()
 
 
-def test_time_above_thr_custom_settings():
+def test_time_above_thr_custom_settings(accelerometer_data):
     """Test TimeAboveThr with custom settings"""
 
     n_samples = 256
@@ -128,16 +122,14 @@ def test_time_above_thr_custom_settings():
     aggregation_window = 120
     threshold = 0.15
 
-    timestamp_start = datetime.now().timestamp()
-    timestamps = timestamp_start + arange(start=0, step=1/fs, stop=int(n_samples/fs))
-
-    df = read_csv(os.path.join(test_folder_path, "accelerometer.csv"), usecols=["x", "y", "z"])
+    timestamp_start = TIMESTAMP_START
+    timestamps = make_timestamps(timestamp_start, fs, n_samples)
 
     imu_data = IMUData(
         timestamps=timestamps,
-        x=df.x.values[:n_samples],
-        y=df.y.values[:n_samples],
-        z=df.z.values[:n_samples],
+        x=accelerometer_data[:n_samples, 0],
+        y=accelerometer_data[:n_samples, 1],
+        z=accelerometer_data[:n_samples, 2],
         fs=fs
     )
 
@@ -181,22 +173,20 @@ def test_time_above_thr_algorithm_properties():
     assert default_settings.threshold == 0.1
 
 
-def test_time_above_thr_output_structure():
+def test_time_above_thr_output_structure(accelerometer_data):
     """Test output DataFrame structure"""
 
     n_samples = 128
     fs = 32
 
-    timestamp_start = datetime.now().timestamp()
-    timestamps = timestamp_start + arange(start=0, step=1/fs, stop=int(n_samples/fs))
-
-    df = read_csv(os.path.join(test_folder_path, "accelerometer.csv"), usecols=["x", "y", "z"])
+    timestamp_start = TIMESTAMP_START
+    timestamps = make_timestamps(timestamp_start, fs, n_samples)
 
     imu_data = IMUData(
         timestamps=timestamps,
-        x=df.x.values[:n_samples],
-        y=df.y.values[:n_samples],
-        z=df.z.values[:n_samples],
+        x=accelerometer_data[:n_samples, 0],
+        y=accelerometer_data[:n_samples, 1],
+        z=accelerometer_data[:n_samples, 2],
         fs=fs
     )
 
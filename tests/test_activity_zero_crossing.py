@@ -1,13 +1,8 @@
-import os
 import pytest
-from datetime import datetime
-
-from numpy import arange
-from pandas import read_csv
 from physiodsp.sensors.imu.accelerometer import AccelerometerData
 from physiodsp.activity.zero_crossing import ZeroCrossing
 
-test_folder_path = os.path.dirname(os.path.realpath(__file__))
+from tests.conftest import TIMESTAMP_START, make_timestamps
 
 
 @pytest.mark.parametrize(
@@ -18,19 +13,18 @@ test_folder_path = os.path.dirname(os.path.realpath(__file__))
             (128)
         ]
 )
-def test_activity_zero_crossing(fs):
+def test_activity_zero_crossing(accelerometer_data, fs):
 
-    df = read_csv(os.path.join(test_folder_path, "accelerometer.csv"), usecols=["x", "y", "z"])
-    n_samples = len(df)
+    n_samples = len(accelerometer_data)
 
-    timestamp_start = datetime.now().timestamp()
-    timestamps = timestamp_start + arange(start=0, step=1/fs, stop=int(n_samples/fs))
+    timestamp_start = TIMESTAMP_START
+    timestamps = make_timestamps(timestamp_start, fs, int(n_samples / fs) * fs)
 
     accelerometer = AccelerometerData(
         timestamps=timestamps,
-        x=df.x.values[:len(timestamps)],
-        y=df.y.values[:len(timestamps)],
-        z=df.z.values[:len(timestamps)],
+        x=accelerometer_data[:len(timestamps), 0],
+        y=accelerometer_data[:len(timestamps), 1],
+        z=accelerometer_data[:len(timestamps), 2],
         fs=fs
     )
 
@@ -1,12 +1,12 @@
 import os
 import pytest
-from datetime import datetime
-
 from numpy import arange, zeros
 from pandas import read_csv
 from physiodsp.sensors.imu.accelerometer import AccelerometerData
 from physiodsp.balance_tests.sway import Sway
 
+from tests.conftest import TIMESTAMP_START
+
 test_folder_path = os.path.dirname(os.path.realpath(__file__))
 
 
@@ -18,17 +18,17 @@ test_folder_path = os.path.dirname(os.path.realpath(__file__))
 )
 def test_balance_test_sway(fs):
 
-    df = read_csv(os.path.join(test_folder_path, "sway.csv"), usecols=["x", "z"])
-    n_samples = len(df)
+    arr = read_csv(os.path.join(test_folder_path, "sway.csv"), usecols=["x", "z"])[["x", "z"]].to_numpy()
+    n_samples = len(arr)
 
-    timestamp_start = datetime.now().timestamp()
+    timestamp_start = TIMESTAMP_START
     timestamps = timestamp_start + arange(start=0, step=1/fs, stop=int(n_samples/fs))
 
     accelerometer = AccelerometerData(
         timestamps=timestamps,
-        x=df.x.values[:len(timestamps)],
+        x=arr[:len(timestamps), 0],
         y=zeros(len(timestamps)),
-        z=df.z.values[:len(timestamps)],
+        z=arr[:len(timestamps), 1],
         fs=fs
     )
 